@@ -1,13 +1,23 @@
+import hashlib
+import io
+import json
 import os
+import tempfile
+import re
 import subprocess
 import sys
-import time
+import threading
+import httpx
+import ijson
 import requests
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+from requests.adapters import HTTPAdapter, Retry
 from urllib.parse import urlparse
 from tqdm import tqdm
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
 
-# Mapping of test suites to categories
+# Mapping of test suites to categories (keys are lowercase for direct lookup)
 TEST_SUITES_DICT = {
     'controls': ['test_suite1', 'test_suite2'],
     'audio': ['test_suite3', 'test_suite8'],  # test_suite3 fails
@@ -21,14 +31,50 @@ REPO_URL = "https://github.com/Darshan-qsc/Github-repo.git"
 GITHUB_TOKEN = ''
 REPO_PATH = r"C:\Users\darshan.s\Documents\Automation_Run_for_Testing_QAT\repo"
 XML_PATH = r"C:\Users\darshan.s\Documents\Automation_Run_for_Testing_QAT\config-file.xml"
+GRAPHQL_URL = "https://api.github.com/graphql"
 JENKINS_URL = "http://urda:8080/job/SQA/job/QAT_Test_Automation_Source_Build/lastSuccessfulBuild/api/json"
 LOG_FILE_PATH = r"C:\Users\darshan.s\AppData\Local\Temp\QSys Temp Files\QAT_CILogFile.txt"
 QAT_FILE_PATH = r"C:\Users\darshan.s\Documents\Automation_Run_for_Testing_QAT\qat_start.bat"
-
-# Add the token to the headers for authentication
-HEADERS = {
-    'Authorization': f'token {GITHUB_TOKEN}'
-}
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+INSTALLED_HASH_PATH = os.path.join(
+    os.environ.get('LOCALAPPDATA', tempfile.gettempdir()), 'qat_installed.sha256')
+
+# Log-tail markers: cheap prefix/substring checks reject most lines, the
+# compiled regex only runs on status candidates.
+STATUS_RE = re.compile(r'CI Execution status :.*?::[^:]*:\s*(\S+)')
+END_MARKER = "QAT Ended"
+
+# Echo every tailed log line only when QAT_VERBOSE is set, and then in
+# batches: per-line console writes dominate wall time on large logs.
+VERBOSE = bool(os.environ.get('QAT_VERBOSE'))
+ECHO_BATCH_LINES = 100
+
+# Add the token to the headers for authentication; with no token configured
+# the header is omitted entirely, since httpx rejects the malformed value
+# 'token ' outright. Accept-Encoding is left alone on purpose: the clients
+# then negotiate gzip/deflate themselves, which shrinks the JSON payloads
+# considerably on the wire.
+HEADERS = {}
+if GITHUB_TOKEN:
+    HEADERS['Authorization'] = f'token {GITHUB_TOKEN}'
+
+# Shared session for the Jenkins endpoints so those calls reuse pooled
+# connections (keep-alive) instead of opening a new TCP/TLS connection per
+# request. The GitHub auth header deliberately stays off this session:
+# Jenkins has no business seeing the token, least of all over plain HTTP.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# HTTP/2 client for api.github.com: the GraphQL pages and the follow-up
+# commit-files request share a single multiplexed TLS connection.
+GITHUB_CLIENT = httpx.Client(http2=True, headers=HEADERS,
+                             limits=httpx.Limits(max_connections=10))
 
 def get_test_suites(file_path, test_suites_dict):
     """
@@ -41,13 +87,8 @@ def get_test_suites(file_path, test_suites_dict):
     Returns:
         list: List of test suites relevant to the file path.
     """
-    parts = file_path.split('/')
-    file_changed = parts[0]
-    results = []
-    for key, suites in test_suites_dict.items():
-        if file_changed.lower() in key.lower():
-            results.append(suites)
-    return results
+    category = file_path.split('/', 1)[0].lower()
+    return test_suites_dict.get(category, [])
 
 
 def get_repo_info(repo_url):
@@ -67,139 +108,291 @@ def get_repo_info(repo_url):
     owner, repo = path_parts[0], path_parts[1].replace('.git', '')
     return owner, repo
 
-def get_branches(owner, repo):
+
+# Derived once at import so callers don't re-parse the constant URL per call.
+OWNER, REPO = get_repo_info(REPO_URL)
+
+# GraphQL query returning the head commit of every branch in one round trip.
+BRANCH_COMMITS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        target {
+          ... on Commit { oid committedDate message author { name } }
+        }
+      }
+    }
+  }
+}
+"""
+
+def get_branch_head_commits(owner, repo):
     """
-    Fetch all branches of the repository.
+    Fetch the latest commit of every branch via the GitHub GraphQL API.
 
     Args:
         owner (str): Repository owner.
         repo (str): Repository name.
 
     Returns:
-        list: List of branch names.
-    """
-    url = f"https://api.github.com/repos/{owner}/{repo}/branches"
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()
-    return [branch['name'] for branch in response.json()]
+        list: Commit details (message, date, files URL, author name) per branch.
+    """
+    commits = []
+    cursor = None
+    commit_url_prefix = f"https://api.github.com/repos/{owner}/{repo}/commits/"
+    while True:
+        response = GITHUB_CLIENT.post(GRAPHQL_URL, json={
+            'query': BRANCH_COMMITS_QUERY,
+            'variables': {'owner': owner, 'name': repo, 'cursor': cursor},
+        })
+        response.raise_for_status()
+        refs = response.json()['data']['repository']['refs']
+        for node in refs['nodes']:
+            target = node['target']
+            commits.append({
+                'message': target['message'],
+                'date': target['committedDate'],
+                'files_url': commit_url_prefix + target['oid'],
+                'author_name': target['author']['name']
+            })
+        if not refs['pageInfo']['hasNextPage']:
+            break
+        cursor = refs['pageInfo']['endCursor']
+    return commits
 
-def get_commit_details(owner, repo, branch):
+def get_files_changed(commit_url):
     """
-    Fetch details of the latest commit in a branch.
+    Fetch the list of files changed in a commit.
 
     Args:
-        owner (str): Repository owner.
-        repo (str): Repository name.
-        branch (str): Branch name.
+        commit_url (str): URL to fetch commit details.
 
     Returns:
-        dict: Commit details including message, date, files URL, and author name.
+        list: List of changed file paths.
     """
-    url = f"https://api.github.com/repos/{owner}/{repo}/commits/{branch}"
-    response = requests.get(url, headers=HEADERS)
+    response = GITHUB_CLIENT.get(commit_url)
     response.raise_for_status()
     commit_data = response.json()
-    return {
-        'message': commit_data['commit']['message'],
-        'date': commit_data['commit']['committer']['date'],  # Commit date is in 'committer' field
-        'files_url': commit_data['url'],  # URL to get full commit info
-        'author_name': commit_data['commit']['author']['name']  # Added to fetch the author's name
-    }
+    return [file['filename'] for file in commit_data.get('files', [])]
 
-def get_files_changed(commit_url):
+class _ResponseReader:
+    """Minimal file-like adapter exposing read() over a streamed response."""
+
+    def __init__(self, response):
+        self._chunks = response.iter_bytes()
+        self._pending = b''
+
+    def read(self, size=-1):
+        while size < 0 or len(self._pending) < size:
+            try:
+                self._pending += next(self._chunks)
+            except StopIteration:
+                break
+        if size < 0 or len(self._pending) <= size:
+            data, self._pending = self._pending, b''
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+def get_first_file_changed(commit_url):
     """
-    Fetch the list of files changed in a commit.
+    Fetch only the first file changed in a commit.
+
+    Streams the commit JSON through ijson and stops as soon as the first
+    filename appears, instead of materializing the whole files array.
 
     Args:
         commit_url (str): URL to fetch commit details.
 
     Returns:
-        list: List of changed file paths.
+        str: Path of the first changed file, or None if the commit has none.
     """
-    response = requests.get(commit_url, headers=HEADERS)
-    response.raise_for_status()
-    commit_data = response.json()
-    return [file['filename'] for file in commit_data.get('files', [])]
+    with GITHUB_CLIENT.stream('GET', commit_url) as response:
+        response.raise_for_status()
+        for filename in ijson.items(_ResponseReader(response), 'files.item.filename'):
+            return filename
+    return None
 
-def find_latest_commit_with_files(repo_url):
+def find_latest_commit_with_files(repo_url=None):
     """
     Find the latest commit across all branches and fetch the files changed.
 
     Args:
-        repo_url (str): GitHub repository URL.
+        repo_url (str, optional): GitHub repository URL; defaults to the
+            configured repository, whose owner/name are parsed at import.
 
     Returns:
         dict: Details of the latest commit including files changed.
     """
-    owner, repo = get_repo_info(repo_url)
-    branches = get_branches(owner, repo)
-
-    latest_commit = None
+    if repo_url is None:
+        owner, repo = OWNER, REPO
+    else:
+        owner, repo = get_repo_info(repo_url)
 
-    # Loop through each branch to find the latest commit
-    for branch in branches:
-        commit = get_commit_details(owner, repo, branch)
-        
-        # Update latest_commit if this commit is more recent
-        if latest_commit is None or commit['date'] > latest_commit['date']:
-            latest_commit = commit
+    # One GraphQL round trip covers all branches, so only the files of the
+    # winning commit still need a REST call.
+    commits = get_branch_head_commits(owner, repo)
+    latest_commit = max(commits, key=lambda commit: commit['date'])
 
-    # Get files changed in the latest commit
-    files_changed = get_files_changed(latest_commit['files_url'])
-    latest_commit['files_changed'] = files_changed
+    # Only the first changed file drives suite selection, so don't pull the
+    # commit's full files list.
+    first_file = get_first_file_changed(latest_commit['files_url'])
+    latest_commit['files_changed'] = [first_file] if first_file else []
     return latest_commit
 
 
-def uncheck_all_test_suites(xml_path):
+# Cache of (mtime, tree) per config path so an unchanged file is not re-parsed.
+_XML_TREE_CACHE = {}
+
+
+def load_config_tree(xml_path):
     """
-    Uncheck all test suites in the XML configuration.
+    Parse the XML configuration, reusing the cached tree when unchanged.
 
     Args:
         xml_path (str): Path to the XML configuration file.
 
     Returns:
-        str: Success message.
+        ET.ElementTree: Parsed XML configuration tree.
+    """
+    mtime = os.path.getmtime(xml_path)
+    cached = _XML_TREE_CACHE.get(xml_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    tree = ET.parse(xml_path)
+    _XML_TREE_CACHE[xml_path] = (mtime, tree)
+    return tree
+
+
+def save_config_tree(tree, xml_path):
+    """
+    Write the tree to disk only if its serialization actually changed.
+
+    Args:
+        tree (ET.ElementTree): Parsed XML configuration tree.
+        xml_path (str): Path to the XML configuration file.
+
+    Returns:
+        bool: True if the file was rewritten, False if it was already current.
     """
+    buffer = io.BytesIO()
+    tree.write(buffer, encoding='utf-8', xml_declaration=True)
+    new_content = buffer.getvalue()
+
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        with open(xml_path, 'rb') as f:
+            if f.read() == new_content:
+                return False
+    except OSError:
+        pass
+
+    with open(xml_path, 'wb') as f:
+        f.write(new_content)
+    _XML_TREE_CACHE[xml_path] = (os.path.getmtime(xml_path), tree)
+    return True
+
+
+def uncheck_all_test_suites(tree):
+    """
+    Uncheck all test suites in the parsed XML configuration.
+
+    Args:
+        tree (ET.ElementTree): Parsed XML configuration tree.
+
+    Returns:
+        str: Success message.
+    """
+    root = tree.getroot()
+
+    # One compiled XPath traversal collects every suite element; attrib
+    # assignment mutates each in a single C call.
+    for item in root.xpath(".//TestSuite/descendant-or-self::*"):
+        item.attrib['IsChecked'] = 'False'
+
+    return "All TestSuites unchecked successfully."
 
-        for test_suite in root.findall(".//TestSuite"):
-            for item in test_suite.iter():
-                item.set('IsChecked', 'False')
 
-        tree.write(xml_path)
-        return "All TestSuites unchecked successfully."
-    except ET.ParseError as e:
+def uncheck_all_test_suites_file(xml_path):
+    """
+    Disk-path wrapper around uncheck_all_test_suites: parse, mutate, write.
+
+    Args:
+        xml_path (str): Path to the XML configuration file.
+
+    Returns:
+        str: Success or error message.
+    """
+    try:
+        tree = load_config_tree(xml_path)
+        message = uncheck_all_test_suites(tree)
+        save_config_tree(tree, xml_path)
+        return message
+    except ET.XMLSyntaxError as e:
         print(f"Error parsing XML file: {e}")
         return "Failed to uncheck test suites."
 
 
-def check_test_suite_items(xml_path, test_suite_name):
+def build_suite_index(tree):
     """
-    Check all items in a specific test suite.
+    Build a name-to-element index of all test suites in the parsed tree.
 
     Args:
-        xml_path (str): Path to the XML configuration file.
+        tree (ET.ElementTree): Parsed XML configuration tree.
+
+    Returns:
+        dict: Mapping of test suite name to its TestSuite element.
+    """
+    return {suite.get('Name'): suite for suite in tree.getroot().iter('TestSuite')}
+
+
+def check_test_suite_items(tree, test_suite_name, suite_index=None):
+    """
+    Check all items in a specific test suite of the parsed XML configuration.
+
+    Args:
+        tree (ET.ElementTree): Parsed XML configuration tree.
         test_suite_name (str): Name of the test suite to check.
+        suite_index (dict, optional): Prebuilt name-to-element index from
+            build_suite_index; avoids a full-tree scan per lookup.
 
     Returns:
         str: Success or error message.
     """
-    try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+    if suite_index is None:
+        suite_index = build_suite_index(tree)
 
-        test_suite = root.find(f".//TestSuite[@Name='{test_suite_name}']")
-        if test_suite is not None:
-            for item in test_suite.iter():
-                item.set('IsChecked', 'True')
+    test_suite = suite_index.get(test_suite_name)
+    if test_suite is not None:
+        for item in test_suite.iter():
+            item.attrib['IsChecked'] = 'True'
 
-            tree.write(xml_path)
-            return f"{test_suite_name} checked successfully."
-        else:
-            return f"TestSuite '{test_suite_name}' not found."
-    except ET.ParseError as e:
+        return f"{test_suite_name} checked successfully."
+    else:
+        return f"TestSuite '{test_suite_name}' not found."
+
+
+def check_test_suite_items_file(xml_path, test_suite_name):
+    """
+    Disk-path wrapper around check_test_suite_items: parse, mutate, write.
+
+    Args:
+        xml_path (str): Path to the XML configuration file.
+        test_suite_name (str): Name of the test suite to check.
+
+    Returns:
+        str: Success or error message.
+    """
+    try:
+        tree = load_config_tree(xml_path)
+        message = check_test_suite_items(tree, test_suite_name)
+        save_config_tree(tree, xml_path)
+        return message
+    except ET.XMLSyntaxError as e:
         print(f"Error parsing XML file: {e}")
         return f"Failed to check test suite '{test_suite_name}'."
 
@@ -215,7 +408,7 @@ def test_fetch_build_data(jenkins_url):
         dict: JSON response containing build data, or None on failure.
     """
     try:
-        response = requests.get(jenkins_url)
+        response = SESSION.get(jenkins_url)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -241,10 +434,52 @@ def test_find_artifact(build_data, extension='.exe'):
     return None, None
 
 
+def _load_artifact_meta(file_name):
+    """
+    Read the sidecar metadata (etag, last_modified, size) of a past download.
+
+    Args:
+        file_name (str): Path of the downloaded file.
+
+    Returns:
+        dict: Stored metadata, or an empty dict if missing or unreadable.
+    """
+    try:
+        with open(file_name + '.meta.json', 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_artifact_meta(file_name, etag, last_modified):
+    """
+    Persist download metadata next to the file for future conditional GETs.
+
+    Args:
+        file_name (str): Path of the downloaded file.
+        etag (str): ETag header of the completed download, if any.
+        last_modified (str): Last-Modified header of the download, if any.
+
+    Returns:
+        None
+    """
+    meta = {
+        'etag': etag,
+        'last_modified': last_modified,
+        'size': os.path.getsize(file_name),
+    }
+    with open(file_name + '.meta.json', 'w') as f:
+        json.dump(meta, f)
+
+
 def test_download_file(url, file_name):
     """
     Download a file from the specified URL with a progress bar.
 
+    Sends a conditional GET with the previous download's ETag/Last-Modified
+    so an unchanged artifact costs one 304 response, and resumes a partial
+    file with a Range request instead of restarting from zero.
+
     Args:
         url (str): URL of the file to download.
         file_name (str): Name to save the downloaded file as.
@@ -252,20 +487,58 @@ def test_download_file(url, file_name):
     Returns:
         str: Path to the downloaded file, or None on failure.
     """
+    meta = _load_artifact_meta(file_name)
+    headers = {}
+    offset = 0
+    if os.path.exists(file_name):
+        size = os.path.getsize(file_name)
+        if size == meta.get('size'):
+            # Complete previous download: ask the server if it changed
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        elif 0 < size < meta.get('size', 0):
+            # Partial previous download: resume from where it stopped
+            offset = size
+            headers['Range'] = f'bytes={offset}-'
+            if meta.get('etag'):
+                # Only resume if the artifact is still the same build
+                headers['If-Range'] = meta['etag']
+
     try:
-        response = requests.get(url, stream=True)
+        response = SESSION.get(url, headers=headers, stream=True)
+        if response.status_code == 304:
+            print(f"Artifact '{file_name}' unchanged on server, reusing cached copy.")
+            return file_name
         response.raise_for_status()
-        total_size = int(response.headers.get('content-length', 0))
-        with open(file_name, "wb") as file, tqdm(
+        if offset and response.status_code != 206:
+            # Server ignored the Range request; restart from the beginning
+            offset = 0
+        response.raw.decode_content = True
+        total_size = int(response.headers.get('content-length', 0)) + offset
+        with open(file_name, "ab" if offset else "wb", buffering=1024 * 1024) as file, tqdm(
             desc=file_name,
             total=total_size,
+            initial=offset,
             unit='iB',
             unit_scale=True,
             unit_divisor=1024,
         ) as bar:
-            for data in response.iter_content(chunk_size=1024):
-                size = file.write(data)
-                bar.update(size)
+            # Read 256 KB at a time straight from the raw stream into one
+            # reusable buffer; readinto avoids allocating a fresh bytes
+            # object per chunk, and 1 KB chunks would make Python call
+            # overhead, not I/O, the bottleneck.
+            buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                count = response.raw.readinto(view)
+                if not count:
+                    break
+                file.write(view[:count])
+                bar.update(count)
+        _save_artifact_meta(file_name, response.headers.get('ETag'),
+                            response.headers.get('Last-Modified'))
         return file_name
     except requests.exceptions.RequestException as e:
         print(f"Error downloading file: {e}")
@@ -274,7 +547,10 @@ def test_download_file(url, file_name):
 
 def install_exe(file_path):
     """
-    Install the downloaded executable file.
+    Install the downloaded executable file, skipping an unchanged build.
+
+    The sha256 of the last installed build is kept in INSTALLED_HASH_PATH;
+    when the new file hashes the same, the installer run is skipped entirely.
 
     Args:
         file_path (str): Path to the executable file.
@@ -283,7 +559,28 @@ def install_exe(file_path):
         None
     """
     try:
+        with open(file_path, 'rb') as f:
+            file_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+
+        try:
+            with open(INSTALLED_HASH_PATH, 'r') as f:
+                if f.read().strip() == file_hash:
+                    print("----------------------------")
+                    print("Build already installed, skipping installation.")
+                    print("----------------------------")
+                    return
+        except OSError:
+            pass
+
         subprocess.run([file_path, "/silent", "/v", "/qn"], check=True)
+
+        # Record the installed build atomically so a crash can't leave a
+        # half-written marker.
+        temp_path = INSTALLED_HASH_PATH + '.tmp'
+        with open(temp_path, 'w') as f:
+            f.write(file_hash)
+        os.replace(temp_path, INSTALLED_HASH_PATH)
+
         print("----------------------------")
         print("Installation completed successfully.")
         print("----------------------------")
@@ -293,6 +590,105 @@ def install_exe(file_path):
         print(f"An unexpected error occurred: {e}")
 
 
+class _LogChangeHandler(FileSystemEventHandler):
+    """Set an event whenever the watched log file is created or modified."""
+
+    def __init__(self, log_file_path, changed):
+        self._log_file_path = os.path.abspath(log_file_path)
+        self._changed = changed
+
+    def on_modified(self, event):
+        if os.path.abspath(event.src_path) == self._log_file_path:
+            self._changed.set()
+
+    on_created = on_modified
+
+
+def tail_log_for_status(log_file_path, process=None):
+    """
+    Follow the log file and parse the CI execution status from it.
+
+    An OS-level file-change notifier (ReadDirectoryChangesW on Windows,
+    inotify on Linux) wakes the loop as soon as the log grows, instead of
+    polling once per second.
+
+    Args:
+        log_file_path (str): Path to the log file to monitor.
+        process (subprocess.Popen, optional): Process writing the log; when
+            given, the tail stops once it has exited and the log is at EOF,
+            even if the QAT-ended marker never appears.
+
+    Returns:
+        str: Status of the task execution, or None if not reported.
+    """
+    changed = threading.Event()
+    observer = Observer()
+    observer.schedule(_LogChangeHandler(log_file_path, changed),
+                      os.path.dirname(log_file_path) or '.')
+    observer.start()
+
+    status = None
+    position = 0
+    pending = b''
+    echo_buffer = []
+    try:
+        # Unbuffered binary reads from an explicit byte offset: nothing is
+        # re-scanned after a wait, partial lines are carried over until their
+        # newline arrives, and a truncated/rotated log restarts cleanly.
+        with open(log_file_path, 'rb', buffering=0) as log_file:
+            done = False
+            while not done:
+                if os.path.getsize(log_file_path) < position:
+                    position = 0
+                    pending = b''
+                log_file.seek(position)
+                chunk = log_file.read()
+                if not chunk:
+                    if process is not None and process.poll() is not None:
+                        if echo_buffer:
+                            print('\n'.join(echo_buffer))
+                            echo_buffer.clear()
+                        print(f"Process exited with code {process.returncode} "
+                              "before the QAT-ended marker was logged.")
+                        break
+                    # Timed wait so a process that dies without a final log
+                    # write is still noticed on the next pass.
+                    changed.wait(timeout=1)
+                    changed.clear()
+                    continue
+                position = log_file.tell()
+
+                pending += chunk
+                raw_lines = pending.split(b'\n')
+                pending = raw_lines.pop()  # trailing partial line, if any
+                for raw_line in raw_lines:
+                    line = raw_line.decode(errors='replace')
+                    if VERBOSE:
+                        echo_buffer.append(line.strip())
+                        if len(echo_buffer) >= ECHO_BATCH_LINES:
+                            print('\n'.join(echo_buffer))
+                            echo_buffer.clear()
+
+                    if line.startswith("CI Execution") and (match := STATUS_RE.search(line)):
+                        status = match.group(1)
+                        if not VERBOSE:
+                            print(line.strip())
+
+                    if END_MARKER in line:
+                        if echo_buffer:
+                            print('\n'.join(echo_buffer))
+                            echo_buffer.clear()
+                        print("QAT test run completed successfully.")
+                        print("----------------------------")
+                        done = True
+                        break
+    finally:
+        observer.stop()
+        observer.join()
+
+    return status
+
+
 def run_scheduled_task(task_name, log_file_path):
     """
     Run a scheduled task and monitor its log file.
@@ -306,35 +702,18 @@ def run_scheduled_task(task_name, log_file_path):
     """
     try:
         # Clear the log file before starting the task
-        with open(log_file_path, 'w') as log_file:
-            log_file.truncate(0)
-    
+        try:
+            os.truncate(log_file_path, 0)
+        except FileNotFoundError:
+            open(log_file_path, 'wb').close()
+
         print(f"Log file cleared successfully.")
 
         subprocess.run(["schtasks", "/run", "/tn", task_name], check=True)
         print(f"Task '{task_name}' started successfully.")
         print("----------------------------")
 
-        status = None
-        with open(log_file_path, 'r') as log_file:
-            while True:
-                line = log_file.readline()
-                if not line:
-                    time.sleep(1)
-                    continue
-                print(line.strip())
-                
-
-                if "CI Execution status :" in line:
-                    parts = line.split("::")
-                    status = parts[1].split(":")[1].strip()
-                
-                if "QAT Ended................" in line:
-                    print("QAT test run completed successfully.")
-                    print("----------------------------")
-                    break
-
-        return status
+        return tail_log_for_status(log_file_path)
     except subprocess.CalledProcessError as e:
         print(f"Failed to execute task '{task_name}'. Error: {e}")
         return None
@@ -355,35 +734,30 @@ def test_run_bat_file(bat_file_path, log_file_path):
     """
     try:
         # Clear the log file before starting the task
-        with open(log_file_path, 'w') as log_file:
-            log_file.truncate(0)
-    
+        try:
+            os.truncate(log_file_path, 0)
+        except FileNotFoundError:
+            open(log_file_path, 'wb').close()
+
         print(f"Log file cleared successfully.")
 
-        subprocess.run([bat_file_path], check=True)
+        # Start the batch file without blocking so the log can be tailed
+        # while it runs, instead of only after it has finished.
+        process = subprocess.Popen([bat_file_path],
+                                   stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL)
         print(f"Batch file '{bat_file_path}' started successfully.")
         print("----------------------------")
 
-        status = None
-        with open(log_file_path, 'r') as log_file:
-            while True:
-                line = log_file.readline()
-                if not line:
-                    time.sleep(1)
-                    continue
-                print(line.strip())
-                
-                if "CI Execution status :" in line:
-                    parts = line.split("::")
-                    status = parts[1].split(":")[1].strip()
-                
-                if "QAT Ended................" in line:
-                    print("QAT test run completed successfully.")
-                    print("----------------------------")
-                    break
+        status = tail_log_for_status(log_file_path, process)
+
+        try:
+            process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            print(f"Batch file '{bat_file_path}' still running after QAT ended.")
 
         return status
-    except subprocess.CalledProcessError as e:
+    except subprocess.SubprocessError as e:
         print(f"Failed to execute batch file '{bat_file_path}'. Error: {e}")
         return None
     except IOError as e:
@@ -410,33 +784,46 @@ def test_check_status(status):
         sys.exit(1)
 
 
-def update_email_description(file_path, email_description_text):
+def update_email_description(tree, email_description_text):
     """
-    Update the email description in the XML configuration.
+    Update the email description in the parsed XML configuration.
 
     Args:
-        file_path (str): Path to the XML configuration file.
+        tree (ET.ElementTree): Parsed XML configuration tree.
         email_description_text (str): Text to set as the email description.
 
     Returns:
         None
     """
-    try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+    root = tree.getroot()
 
-        for email_detail in root.findall('Emaildetails'):
-            email_detail.set('EmailDescriptionCheck', 'True')
-            email_detail.set('EmailDescriptionText', email_description_text)
+    for email_detail in root.findall('Emaildetails'):
+        email_detail.set('EmailDescriptionCheck', 'True')
+        email_detail.set('EmailDescriptionText', email_description_text)
 
-        tree.write(file_path, encoding='utf-8', xml_declaration=True)
-    except ET.ParseError as e:
+
+def update_email_description_file(file_path, email_description_text):
+    """
+    Disk-path wrapper around update_email_description: parse, mutate, write.
+
+    Args:
+        file_path (str): Path to the XML configuration file.
+        email_description_text (str): Text to set as the email description.
+
+    Returns:
+        None
+    """
+    try:
+        tree = load_config_tree(file_path)
+        update_email_description(tree, email_description_text)
+        save_config_tree(tree, file_path)
+    except ET.XMLSyntaxError as e:
         print(f"Error parsing XML file: {e}")
 
 
 if __name__ == "__main__":
     # Process the commit
-    # latest = find_latest_commit_with_files(REPO_URL)
+    # latest = find_latest_commit_with_files()
     # commit_message = latest['message']
     # files = latest['files_changed']
     # author_name = latest['author_name']
@@ -450,16 +837,20 @@ if __name__ == "__main__":
     # print(f"File Changed: {files_changed}")
     # print("----------------------------")
 
+    # Parse the config once, apply all mutations in memory, write once
+    # tree = load_config_tree(XML_PATH)
+
     # Uncheck all test suites
-    # print(uncheck_all_test_suites(XML_PATH))
+    # print(uncheck_all_test_suites(tree))
 
     # # Check relevant test suites
-    # test_suites = get_test_suites(files_changed, TEST_SUITES_DICT)
-    # for suite in [item for sublist in test_suites for item in sublist]:
-    #     print(check_test_suite_items(XML_PATH, suite))
+    # suite_index = build_suite_index(tree)
+    # for suite in get_test_suites(files_changed, TEST_SUITES_DICT):
+    #     print(check_test_suite_items(tree, suite, suite_index))
     # print("----------------------------")
 
-    # update_email_description(XML_PATH, commit_message)
+    # update_email_description(tree, commit_message)
+    # save_config_tree(tree, XML_PATH)
 
     # Fetch build data from Jenkins
     build_data = test_fetch_build_data(JENKINS_URL)
@@ -0,0 +1,66 @@
+import json
+
+import ijson
+
+import test_app
+
+
+def _chunked(payload, size=7):
+    return [payload[i:i + size] for i in range(0, len(payload), size)]
+
+
+class FakeStreamResponse:
+    """Stand-in for a streamed httpx response yielding small byte chunks."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def iter_bytes(self):
+        return iter(_chunked(self._payload))
+
+    def raise_for_status(self):
+        return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+COMMIT_PAYLOAD = json.dumps({
+    'sha': 'abc123',
+    'files': [
+        {'filename': 'audio/foo.cpp'},
+        {'filename': 'video/bar.cpp'},
+    ],
+}).encode()
+
+
+def test_response_reader_reassembles_chunks():
+    reader = test_app._ResponseReader(FakeStreamResponse(COMMIT_PAYLOAD))
+    data = b''
+    while True:
+        chunk = reader.read(11)
+        if not chunk:
+            break
+        data += chunk
+    assert data == COMMIT_PAYLOAD
+
+
+def test_response_reader_feeds_ijson():
+    reader = test_app._ResponseReader(FakeStreamResponse(COMMIT_PAYLOAD))
+    assert next(ijson.items(reader, 'files.item.filename')) == 'audio/foo.cpp'
+
+
+def test_get_first_file_changed(monkeypatch):
+    monkeypatch.setattr(test_app.GITHUB_CLIENT, 'stream',
+                        lambda method, url: FakeStreamResponse(COMMIT_PAYLOAD))
+    assert test_app.get_first_file_changed('http://example/commit') == 'audio/foo.cpp'
+
+
+def test_get_first_file_changed_without_files(monkeypatch):
+    payload = json.dumps({'sha': 'abc123', 'files': []}).encode()
+    monkeypatch.setattr(test_app.GITHUB_CLIENT, 'stream',
+                        lambda method, url: FakeStreamResponse(payload))
+    assert test_app.get_first_file_changed('http://example/commit') is None